@@ -20,10 +20,15 @@ class PagesSortByTime(PagesSorter):
 
 
 class PagesSortByFolderAndTime(PagesSorter):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Compute the reference date once per sort rather than once per page
+        self._today = date.today()
+
     def __call__(self, page: dict) -> Tuple:
         return (
             page.get('folder'),
-            date.today() - page.get(
+            self._today - page.get(
                 'published', self._default_published
             )
         )
@@ -1,7 +1,8 @@
 import datetime
 import os
 import re
-from typing import Optional, List, Tuple, Type
+import stat
+from typing import Dict, Optional, List, Tuple, Type
 
 from flask import Flask, abort
 from markdown import markdown
@@ -13,6 +14,8 @@ from ._sorters import PagesSorter, PagesSortByTime
 
 class BlogApp(Flask):
     _title_header_regex = re.compile(r"^#\s*((\[(.*)\])|(.*))")
+    _author_regex = re.compile(r"(.+?)\s+<([^>]+)>")
+    _metadata_prefix = "[//]: # ("
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, template_folder=config.templates_dir, **kwargs)
@@ -21,12 +24,19 @@ class BlogApp(Flask):
         self.css_dir = config.default_css_dir
         self.js_dir = config.default_js_dir
         self.fonts_dir = config.default_fonts_dir
+        # Normalized absolute path of the page -> (file stat signature,
+        # metadata), so `./a` or `sub/../a` share the entry of `a`, and the
+        # entry is refreshed when the file changes
+        self._metadata_cache: Dict[str, Tuple[tuple, dict]] = {}
 
         if not os.path.isdir(self.pages_dir):
             # If the `markdown` subfolder does not exist, then the whole
             # `config.content_dir` is treated as the root for markdown files.
             self.pages_dir = config.content_dir
 
+        # Resolved once, used to build the normalized paths of the pages
+        self._pages_prefix = os.path.join(os.path.abspath(self.pages_dir), "")
+
         img_dir = os.path.join(config.content_dir, "img")
         if os.path.isdir(img_dir):
             self.img_dir = os.path.abspath(img_dir)
@@ -53,39 +63,60 @@ class BlogApp(Flask):
         if not page.endswith(".md"):
             page = page + ".md"
 
-        md_file = os.path.join(self.pages_dir, page)
-        if not os.path.isfile(md_file):
+        md_file = os.path.normpath(os.path.join(self._pages_prefix, page))
+        try:
+            st = os.stat(md_file)
+        except OSError:
+            st = None
+
+        if not (st and stat.S_ISREG(st.st_mode)):
+            # Drop any entry left behind by a page that has been removed
+            self._metadata_cache.pop(md_file, None)
             abort(404)
 
+        # The URI is derived from the normalized path on each call rather
+        # than cached, so the aliases of a page all get the same one
+        if md_file.startswith(self._pages_prefix):
+            rel_path = md_file[len(self._pages_prefix) :]
+        else:
+            rel_path = os.path.relpath(md_file, self._pages_prefix)
+        uri = "/article/" + rel_path[:-3]
+
+        file_signature = (st.st_ctime_ns, st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = self._metadata_cache.get(md_file)
+        if cached and cached[0] == file_signature:
+            return {"uri": uri, **cached[1]}
+
+        metadata = self._parse_page_metadata(md_file, st)
+        self._metadata_cache[md_file] = (file_signature, metadata)
+        return {"uri": uri, **metadata}
+
+    def _parse_page_metadata(self, md_file: str, st: os.stat_result) -> dict:
         metadata = {}
         with open(md_file, "r") as f:
-            metadata["uri"] = "/article/" + page[:-3]
+            # Keep the first line, the title may have to be inferred from it
+            first_line = None
 
             for line in f:
+                if first_line is None:
+                    first_line = line
                 if not line:
                     continue
 
-                if not (m := re.match(r"^\[//]: # \(([^:]+):\s*(.*)\)\s*$", line)):
+                if not (header := self._parse_metadata_line(line)):
                     break
 
-                if m.group(1) == "published":
-                    metadata[m.group(1)] = datetime.datetime.fromisoformat(
-                        m.group(2)
-                    ).date()
+                key, value = header
+                if key == "published":
+                    metadata[key] = datetime.datetime.fromisoformat(value).date()
                 else:
-                    metadata[m.group(1)] = m.group(2)
+                    metadata[key] = value
 
         if not metadata.get("title"):
             # If the `title` header isn't available in the file,
             # infer it from the first line of the file
-            with open(md_file, "r") as f:
-                header = ""
-                for line in f.readlines():
-                    header = line
-                    break
-
             metadata["title_inferred"] = True
-            m = self._title_header_regex.search(header)
+            m = self._title_header_regex.search(first_line or "")
             if m:
                 metadata["title"] = m.group(3) or m.group(1)
             else:
@@ -94,13 +125,25 @@ class BlogApp(Flask):
         if not metadata.get("published"):
             # If the `published` header isn't available in the file,
             # infer it from the file's creation date
-            metadata["published"] = datetime.date.fromtimestamp(
-                os.stat(md_file).st_ctime
-            )
+            metadata["published"] = datetime.date.fromtimestamp(st.st_ctime)
             metadata["published_inferred"] = True
 
         return metadata
 
+    @classmethod
+    def _parse_metadata_line(cls, line: str) -> Optional[Tuple[str, str]]:
+        # Parses a `[//]: # (key: value)` header line with plain string
+        # operations, which is cheaper than running a regex on each line
+        line = line.rstrip()
+        if not (line.startswith(cls._metadata_prefix) and line.endswith(")")):
+            return None
+
+        key, sep, value = line[len(cls._metadata_prefix) : -1].partition(":")
+        if not (sep and key):
+            return None
+
+        return key, value.lstrip()
+
     def get_page(
         self,
         page: str,
@@ -116,6 +159,15 @@ class BlogApp(Flask):
         if not (title or metadata.get("title_inferred")):
             title = metadata.get("title", config.title)
 
+        author = author_email = None
+        if "author" in metadata:
+            # Match the `Name <email>` header once and extract both fields
+            m = self._author_regex.match(metadata["author"])
+            if m:
+                author, author_email = m.group(1), m.group(2)
+            else:
+                author = metadata["author"]
+
         with open(os.path.join(self.pages_dir, page), "r") as f:
             return render_template(
                 "article.html",
@@ -123,16 +175,8 @@ class BlogApp(Flask):
                 title=title,
                 image=metadata.get("image"),
                 description=metadata.get("description"),
-                author=(
-                    re.match(r"(.+?)\s+<([^>]+>)", metadata["author"])[1]
-                    if "author" in metadata
-                    else None
-                ),
-                author_email=(
-                    re.match(r"(.+?)\s+<([^>]+)>", metadata["author"])[2]
-                    if "author" in metadata
-                    else None
-                ),
+                author=author,
+                author_email=author_email,
                 published=(
                     metadata["published"].strftime("%b %d, %Y")
                     if metadata.get("published")
@@ -155,25 +199,36 @@ class BlogApp(Flask):
         reverse: bool = True,
     ) -> List[Tuple[int, dict]]:
         pages_dir = app.pages_dir.rstrip("/")
-        pages = [
-            {
-                "path": os.path.join(root[len(pages_dir) + 1 :], f),
-                "folder": root[len(pages_dir) + 1 :],
-                "content": (
-                    self.get_page(
-                        os.path.join(root, f),
-                        skip_header=skip_header,
-                        skip_html_head=skip_html_head,
-                    )
-                    if with_content
-                    else ""
-                ),
-                **self.get_page_metadata(os.path.join(root[len(pages_dir) + 1 :], f)),
-            }
-            for root, _, files in os.walk(pages_dir, followlinks=True)
-            for f in files
-            if f.endswith(".md")
-        ]
+        pages = []
+
+        for root, _, files in os.walk(pages_dir, followlinks=True):
+            # Path of the folder relative to the pages root, computed once
+            # per directory rather than for each field of each page
+            folder = root[len(pages_dir) + 1 :]
+
+            for f in files:
+                if not f.endswith(".md"):
+                    continue
+
+                path = os.path.join(folder, f)
+                pages.append(
+                    {
+                        "path": path,
+                        "folder": folder,
+                        "content": (
+                            # Same relative path as the metadata lookup
+                            # below, so the metadata is parsed only once
+                            self.get_page(
+                                path,
+                                skip_header=skip_header,
+                                skip_html_head=skip_html_head,
+                            )
+                            if with_content
+                            else ""
+                        ),
+                        **self.get_page_metadata(path),
+                    }
+                )
 
         sorter_func = sorter(pages)
         pages.sort(key=sorter_func, reverse=reverse)
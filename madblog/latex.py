@@ -85,14 +85,6 @@ class LaTeXPreprocessor(markdown.preprocessors.Preprocessor):
     )
 
     def __init__(self, *_, **__):
-        if not os.path.isdir(tmpdir):
-            os.makedirs(tmpdir)
-        try:
-            with open(cache_file, "r") as f:
-                self.cached = json.load(f)
-        except (IOError, json.JSONDecodeError):
-            self.cached = {}
-
         self.config = {
             ("general", "preamble"): "",
             ("dvipng", "args"): "-q -T tight -bg Transparent -z 9 -D 200",
@@ -101,6 +93,16 @@ class LaTeXPreprocessor(markdown.preprocessors.Preprocessor):
             ("delimiters", "preamble"): "%%",
         }
 
+    def _load_cache(self):
+        """Creates the temp dir and loads the cached expressions"""
+        if not os.path.isdir(tmpdir):
+            os.makedirs(tmpdir)
+        try:
+            with open(cache_file, "r") as f:
+                self.cached = json.load(f)
+        except (IOError, json.JSONDecodeError):
+            self.cached = {}
+
     def _latex_to_base64(self, tex):
         """Generates a base64 representation of TeX string"""
 
@@ -174,6 +176,9 @@ class LaTeXPreprocessor(markdown.preprocessors.Preprocessor):
         if not use_latex:
             return lines
 
+        # Only pay for the cache setup on pages that actually use LaTeX
+        self._load_cache()
+
         # Re-creates the entire page so we can parse in a multiline env.
         page = "\n".join(lines)
 
@@ -191,19 +196,20 @@ class LaTeXPreprocessor(markdown.preprocessors.Preprocessor):
 
         # Parse the expressions
         new_cache = {}
-        new_page = ""
+        # Collect the output chunks and join them once at the end
+        new_page = []
         n_multiline_expressions = 0
 
         while page:
             m = self.math_extract_regex.match(page)
             if not m:
-                new_page += page
+                new_page.append(page)
                 break
 
-            new_page += m.group(1)
+            new_page.append(m.group(1))
             math_match = self.math_match_regex.match(m.group(2))
             if not math_match:
-                new_page += m.group(2)
+                new_page.append(m.group(2))
             else:
                 expr = m.group(2)
                 is_multiline = math_match.group(2) is not None
@@ -215,21 +221,20 @@ class LaTeXPreprocessor(markdown.preprocessors.Preprocessor):
                     new_cache[tex_hash] = data
 
                 if is_multiline and n_multiline_expressions > 0:
-                    new_page += "</p>"
-                new_page += (multiline_img_expr if is_multiline else img_expr) % (
-                    "true",
-                    tex_hash,
-                    data,
+                    new_page.append("</p>")
+                new_page.append(
+                    (multiline_img_expr if is_multiline else img_expr)
+                    % ("true", tex_hash, data)
                 )
 
                 if is_multiline:
-                    new_page += "<p>"
+                    new_page.append("<p>")
                     n_multiline_expressions += 1
 
             page = m.group(5)
 
         if n_multiline_expressions > 0:
-            new_page += "</p>"
+            new_page.append("</p>")
 
         # Cache our data
         self.cached.update(new_cache)
@@ -237,7 +242,7 @@ class LaTeXPreprocessor(markdown.preprocessors.Preprocessor):
             json.dump(self.cached, f)
 
         # Make sure to re-split the lines
-        return new_page.split("\n")
+        return "".join(new_page).split("\n")
 
     @staticmethod
     def hash(tex: str) -> str:
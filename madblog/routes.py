@@ -10,18 +10,32 @@ from flask import (
     send_from_directory as send_from_directory_,
     render_template,
 )
+from werkzeug.exceptions import NotFound
 
 from .app import app
 from .config import config
 from ._sorters import PagesSortByTimeGroupedByFolder
 
+_absolute_url_regex = re.compile(r"^https?://")
+
+# Icons advertised by the default generated manifest.json
+_default_manifest_icons = [
+    {"src": f"/img/icon-{size}.png", "sizes": f"{size}x{size}", "type": "image/png"}
+    for size in (48, 72, 96, 144, 168, 192, 256, 512)
+]
+
 
 def send_from_directory(
     path: str, file: str, alternative_path: Optional[str] = None, *args, **kwargs
 ):
-    if not os.path.exists(os.path.join(path, file)) and alternative_path:
-        path = alternative_path
-    return send_from_directory_(path, file, *args, **kwargs)
+    try:
+        return send_from_directory_(path, file, *args, **kwargs)
+    except NotFound:
+        # Only fall back to the alternative path if the file is missing
+        if not alternative_path:
+            raise
+
+    return send_from_directory_(alternative_path, file, *args, **kwargs)
 
 
 @app.route("/", methods=["GET"])
@@ -82,16 +96,7 @@ def manifest_route():
         {
             "name": config.title,
             "short_name": config.title,
-            "icons": [
-                {"src": "/img/icon-48.png", "sizes": "48x48", "type": "image/png"},
-                {"src": "/img/icon-72.png", "sizes": "72x72", "type": "image/png"},
-                {"src": "/img/icon-96.png", "sizes": "96x96", "type": "image/png"},
-                {"src": "/img/icon-144.png", "sizes": "144x144", "type": "image/png"},
-                {"src": "/img/icon-168.png", "sizes": "168x168", "type": "image/png"},
-                {"src": "/img/icon-192.png", "sizes": "192x192", "type": "image/png"},
-                {"src": "/img/icon-256.png", "sizes": "256x256", "type": "image/png"},
-                {"src": "/img/icon-512.png", "sizes": "512x512", "type": "image/png"},
-            ],
+            "icons": _default_manifest_icons,
             "gcm_sender_id": "",
             "gcm_user_visible_only": True,
             "start_url": "/",
@@ -182,7 +187,7 @@ def rss_route():
                         image=(
                             urljoin(config.link, page["image"])
                             if page.get("image")
-                            and not re.search(r"^https?://", page["image"])
+                            and not _absolute_url_regex.match(page["image"])
                             else page.get("image", "")
                         ),
                     )